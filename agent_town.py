@@ -9,12 +9,17 @@ from agent_town_sim.map import canvas_size, draw_hud, draw_world, require_pygame
 
 
 def summarize_world(world: World) -> Dict[str, object]:
+    agent_ids, agent_xy, agent_energy = world.agent_arrays()
     summary = {
         "tick": world.tick,
         "size": {"width": world.width, "height": world.height},
         "agents": {
-            agent.id: {"name": agent.name, "position": agent.position, "energy": agent.energy}
-            for agent in world.agents.values()
+            agent_id: {
+                "name": world.agents[agent_id].name,
+                "position": (int(x), int(y)),
+                "energy": int(energy),
+            }
+            for agent_id, (x, y), energy in zip(agent_ids, agent_xy, agent_energy)
         },
     }
     if hasattr(world, "active_help_requests"):
@@ -39,23 +44,36 @@ def interactive_simulation(
     pg = require_pygame()
     world = seed_world(agent_count=agent_count, debug=debug, width=w, height=h)
     pg.init()
+    # Only QUIT and KEYDOWN are handled below; blocking everything else keeps
+    # mouse motion and window chatter out of the queue entirely.
+    pg.event.set_blocked(None)
+    pg.event.set_allowed([pg.QUIT, pg.KEYDOWN])
     width, height = canvas_size(world, cell_size)
     screen = pg.display.set_mode((width, height))
     pg.display.set_caption("Agent Town Grid")
     clock = pg.time.Clock()
-    agent_font = pg.font.SysFont(None, max(16, int(cell_size * 0.45)))
-    hud_font = pg.font.SysFont(None, 20)
+    # Pin a concrete font file once; SysFont can re-probe system fonts on
+    # some platforms. match_font may return None, which Font treats as the
+    # bundled default.
+    font_path = pg.font.match_font("arial")
+    agent_font = pg.font.Font(font_path, max(16, int(cell_size * 0.45)))
+    hud_font = pg.font.Font(font_path, 20)
 
     paused = False
     running = True
     step_interval = 1.0 / max(steps_per_second, 0.0001)
     accumulator = 0.0
+    dirty = True  # The world or HUD changed and the screen needs a repaint.
+    # The grid is rasterized into an off-screen surface once per sim tick;
+    # frames in between just blit it.
+    world_surface = pg.Surface((width, height))
+    last_rendered_tick = -1
 
     print("Controls: ESC to quit | SPACE to pause/resume | N to step once while paused")
 
     while running:
         dt = clock.tick(fps) / 1000.0
-        for event in pg.event.get():
+        for event in pg.event.get((pg.QUIT, pg.KEYDOWN)):
             if event.type == pg.QUIT:
                 running = False
             elif event.type == pg.KEYDOWN:
@@ -63,35 +81,44 @@ def interactive_simulation(
                     running = False
                 elif event.key == pg.K_SPACE:
                     paused = not paused
+                    dirty = True
                 elif event.key == pg.K_n:
                     world.step()
+                    dirty = True
 
         if not paused:
             accumulator += dt
-            while accumulator >= step_interval:
-                world.step()
-                accumulator -= step_interval
-
-        draw_world(screen, world, cell_size, font=agent_font)
-        carried_energy = sum(agent.energy for agent in world.agents.values())
-        hud_lines = [
-            f"Tick: {world.tick}",
-            "Paused" if paused else f"Steps/sec: {steps_per_second:.2f}",
-            f"Agents: {len(world.agents)}",
-            f"Carried energy: {carried_energy}",
-        ]
-        if hasattr(world, "reactor"):
-            hud_lines.append(f"Reactor: {world.reactor.energy}/{world.reactor.capacity}")
-        if hasattr(world, "deposit_history"):
-            history = world.deposit_history()
-            recent_reports = history[-3:]
-            for tick, agent_id, actual, claimed, lie in reversed(recent_reports):
-                marker = "✔" if not lie else "✘"
-                hud_lines.append(
-                    f"{agent_id} dep:{actual} rep:{claimed} lie:{marker} (t{tick})"
-                )
-        draw_hud(screen, hud_lines, pg, hud_font)
-        pg.display.flip()
+            steps = int(accumulator // step_interval)
+            if steps:
+                accumulator -= steps * step_interval
+                world.step_many(steps)
+                dirty = True
+
+        if dirty:
+            if world.tick != last_rendered_tick:
+                draw_world(world_surface, world, cell_size, font=agent_font)
+                last_rendered_tick = world.tick
+            screen.blit(world_surface, (0, 0))
+            carried_energy = int(world.agent_arrays()[2].sum())
+            hud_lines = [
+                f"Tick: {world.tick}",
+                "Paused" if paused else f"Steps/sec: {steps_per_second:.2f}",
+                f"Agents: {len(world.agents)}",
+                f"Carried energy: {carried_energy}",
+            ]
+            if hasattr(world, "reactor"):
+                hud_lines.append(f"Reactor: {world.reactor.energy}/{world.reactor.capacity}")
+            if hasattr(world, "deposit_history"):
+                history = world.deposit_history()
+                recent_reports = history[-3:]
+                for tick, agent_id, actual, claimed, lie in reversed(recent_reports):
+                    marker = "✔" if not lie else "✘"
+                    hud_lines.append(
+                        f"{agent_id} dep:{actual} rep:{claimed} lie:{marker} (t{tick})"
+                    )
+            draw_hud(screen, hud_lines, pg, hud_font)
+            pg.display.flip()
+            dirty = False
 
     pg.quit()
     return world
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit  # type: ignore
+except Exception:  # pragma: no cover - numba is optional; fall back to pure Python.
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+
+        return wrap
+
+
+# Cardinal move bits; values must match models.MOVE_EAST/WEST/SOUTH/NORTH.
+_EAST, _WEST, _SOUTH, _NORTH = 1, 2, 4, 8
+
+
+@njit(cache=True)
+def pick_move(ax: int, ay: int, tx: int, ty: int, moves_mask: int):
+    """
+    Best unblocked cardinal step from (ax, ay) towards (tx, ty).
+
+    Prefers the major axis, then the minor one; returns (0, 0) when both
+    distance-closing moves are blocked (idling beats backtracking).
+    """
+    dx = tx - ax
+    dy = ty - ay
+    dx_sign = (dx > 0) - (dx < 0)
+    dy_sign = (dy > 0) - (dy < 0)
+    x_bit = _EAST if dx_sign > 0 else (_WEST if dx_sign < 0 else 0)
+    y_bit = _SOUTH if dy_sign > 0 else (_NORTH if dy_sign < 0 else 0)
+    if abs(dx) >= abs(dy):
+        if x_bit and moves_mask & x_bit:
+            return dx_sign, 0
+        if y_bit and moves_mask & y_bit:
+            return 0, dy_sign
+    else:
+        if y_bit and moves_mask & y_bit:
+            return 0, dy_sign
+        if x_bit and moves_mask & x_bit:
+            return dx_sign, 0
+    return 0, 0
+
+
+@njit(cache=True)
+def best_energy_spot(ax, ay, energy_grid, vision, agent_energy, decay):
+    """
+    Scan the energy grid for the best reachable spot within vision of (ax, ay).
+
+    Ranks by Manhattan distance, ties broken by higher energy; a spot is
+    reachable when the agent can survive the walk at the given decay rate.
+    Returns (x, y, distance), or (-1, -1, -1) when nothing qualifies.
+    """
+    height, width = energy_grid.shape
+    y0 = ay - vision if ay - vision > 0 else 0
+    y1 = ay + vision if ay + vision < height - 1 else height - 1
+    x0 = ax - vision if ax - vision > 0 else 0
+    x1 = ax + vision if ax + vision < width - 1 else width - 1
+    best_x = -1
+    best_y = -1
+    best_dist = -1
+    best_energy = 0
+    for yy in range(y0, y1 + 1):
+        for xx in range(x0, x1 + 1):
+            energy = energy_grid[yy, xx]
+            if energy <= 0:
+                continue
+            dist = abs(xx - ax) + abs(yy - ay)
+            if dist > vision:
+                continue
+            if dist != 0 and agent_energy <= decay * dist:
+                continue
+            if best_dist < 0 or dist < best_dist or (dist == best_dist and energy > best_energy):
+                best_x = xx
+                best_y = yy
+                best_dist = dist
+                best_energy = energy
+    return best_x, best_y, best_dist
+
+
+@njit(cache=True)
+def rank_helpers(ax, ay, xs, ys, energies, min_energy, vision, skip):
+    """
+    Index of the best potential donor: closest by Manhattan distance within
+    vision, ties broken by Chebyshev distance, among agents holding at least
+    min_energy. The row at index `skip` (the requester itself) is ignored.
+    Returns -1 when no candidate qualifies.
+    """
+    best = -1
+    best_manhattan = 0
+    best_chebyshev = 0
+    for i in range(xs.shape[0]):
+        if i == skip or energies[i] < min_energy:
+            continue
+        dx = xs[i] - ax
+        dy = ys[i] - ay
+        adx = dx if dx >= 0 else -dx
+        ady = dy if dy >= 0 else -dy
+        manhattan = adx + ady
+        if manhattan > vision:
+            continue
+        chebyshev = adx if adx >= ady else ady
+        if best < 0 or manhattan < best_manhattan or (
+            manhattan == best_manhattan and chebyshev < best_chebyshev
+        ):
+            best = i
+            best_manhattan = manhattan
+            best_chebyshev = chebyshev
+    return best
+
+
+@njit(cache=True)
+def dwindle_grids(energy_grid, resource_grid, amount):
+    """
+    Drain `amount` from every energised cell in place, clearing resource
+    flags that hit zero. Returns the flat indices (y * width + x) of cells
+    whose resource was exhausted by this drain.
+    """
+    height, width = energy_grid.shape
+    exhausted = np.empty(height * width, dtype=np.int32)
+    count = 0
+    for yy in range(height):
+        for xx in range(width):
+            value = energy_grid[yy, xx]
+            if value <= 0:
+                continue
+            value -= amount
+            if value < 0:
+                value = 0
+            energy_grid[yy, xx] = value
+            if value == 0 and resource_grid[yy, xx]:
+                resource_grid[yy, xx] = False
+                exhausted[count] = yy * width + xx
+                count += 1
+    return exhausted[:count]
+
+
+@njit(cache=True)
+def decay_energies(energies, decay):
+    """
+    Subtract `decay` from every agent energy in place, clamped at zero.
+    Returns the rows that reached zero and should be removed.
+    """
+    dead = np.empty(energies.shape[0], dtype=np.int32)
+    count = 0
+    for i in range(energies.shape[0]):
+        value = energies[i] - decay
+        if value < 0:
+            value = 0
+        energies[i] = value
+        if value == 0:
+            dead[count] = i
+            count += 1
+    return dead[:count]
+
+
+__all__ = [
+    "pick_move",
+    "best_energy_spot",
+    "rank_helpers",
+    "dwindle_grids",
+    "decay_energies",
+]
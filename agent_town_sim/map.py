@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import Iterable, Tuple, TYPE_CHECKING
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
 
 try:
     import pygame  # type: ignore
@@ -47,14 +51,23 @@ def canvas_size(world: "World", cell_size: int) -> Tuple[int, int]:
     return world.width * cell_size, world.height * cell_size
 
 
-def _cell_fill_color(world: "World", x: int, y: int) -> Tuple[int, int, int]:
-    energy = world.cell_energy(x, y)
-    max_energy = getattr(world, "max_energy", 0) or 1
-    clamped_energy = max(0, min(energy, max_energy))
-    ratio = clamped_energy / max_energy
-    return tuple(
-        int(low + (high - low) * ratio) for low, high in zip(ENERGY_LOW_COLOR, ENERGY_HIGH_COLOR)
-    )
+_ENERGY_LOW_ARR = np.array(ENERGY_LOW_COLOR, dtype=np.float32)
+_ENERGY_HIGH_ARR = np.array(ENERGY_HIGH_COLOR, dtype=np.float32)
+
+# 256-entry lerp table so per-agent colors are a single indexed lookup.
+_AGENT_COLOR_LUT = np.array(
+    [
+        [
+            int(low + (high - low) * i / 255)
+            for low, high in zip(AGENT_LOW_ENERGY_COLOR, AGENT_HIGH_ENERGY_COLOR)
+        ]
+        for i in range(256)
+    ],
+    dtype=np.uint8,
+)
+
+# Number of buckets the energy ratio is quantized into for marker caching.
+_MARKER_BUCKETS = 16
 
 
 def _agent_energy_ratio(agent) -> float:
@@ -65,12 +78,10 @@ def _agent_energy_ratio(agent) -> float:
     return max(0.0, min(1.0, energy / max_capacity))
 
 
-def _agent_energy_color(agent) -> Tuple[int, int, int]:
-    ratio = _agent_energy_ratio(agent)
-    return tuple(
-        int(low + (high - low) * ratio)
-        for low, high in zip(AGENT_LOW_ENERGY_COLOR, AGENT_HIGH_ENERGY_COLOR)
-    )
+def _agent_energy_color(ratio: float) -> Tuple[int, int, int]:
+    index = max(0, min(255, int(ratio * 255)))
+    r, g, b = _AGENT_COLOR_LUT[index]
+    return int(r), int(g), int(b)
 
 
 def draw_world(surface, world: "World", cell_size: int, font=None) -> None:
@@ -78,22 +89,52 @@ def draw_world(surface, world: "World", cell_size: int, font=None) -> None:
     Render the grid world onto a pygame surface.
     """
     pg = require_pygame()
+    screen_size = surface.get_size()
     surface.fill(BACKGROUND_COLOR)
     _draw_grid(surface, world, cell_size, pg)
     _draw_reactor(surface, world, cell_size, pg)
     _draw_agents(surface, world, cell_size, pg, font)
-    _draw_reactor_meter(surface, world, pg, font)
+    _draw_reactor_meter(surface, world, pg, font, screen_size)
 
 
-def _draw_grid(surface, world: "World", cell_size: int, pg) -> None:
-    width, height = world.width, world.height
+@dataclass
+class _GridCache:
+    key: Tuple[int, int, int]  # (width, height, cell_size) the cache was built for.
+    outline_overlay: object  # Transparent surface carrying only the checkerboard outlines.
+
+
+_grid_cache: Optional[_GridCache] = None
+
+
+def _build_grid_cache(key: Tuple[int, int, int], pg) -> _GridCache:
+    width, height, cell_size = key
+    overlay = pg.Surface((width * cell_size, height * cell_size), pg.SRCALPHA)
     for x in range(width):
         for y in range(height):
             rect = pg.Rect(x * cell_size, y * cell_size, cell_size, cell_size)
-            fill_color = _cell_fill_color(world, x, y)
-            pg.draw.rect(surface, fill_color, rect)
             outline_color = GRID_LINE_HIGHLIGHT if (x + y) % 2 == 0 else GRID_LINE_COLOR
-            pg.draw.rect(surface, outline_color, rect, width=1)
+            pg.draw.rect(overlay, outline_color, rect, width=1)
+    return _GridCache(key=key, outline_overlay=overlay)
+
+
+def _get_grid_cache(world: "World", cell_size: int, pg) -> _GridCache:
+    global _grid_cache
+    key = (world.width, world.height, cell_size)
+    if _grid_cache is None or _grid_cache.key != key:
+        _grid_cache = _build_grid_cache(key, pg)
+    return _grid_cache
+
+
+def _draw_grid(surface, world: "World", cell_size: int, pg) -> None:
+    cache = _get_grid_cache(world, cell_size, pg)
+    grid = world.energy_array()
+    max_energy = getattr(world, "max_energy", 0) or 1
+    ratio = np.clip(grid.astype(np.float32) / max_energy, 0.0, 1.0)[:, :, None]
+    rgb = (_ENERGY_LOW_ARR + (_ENERGY_HIGH_ARR - _ENERGY_LOW_ARR) * ratio).astype(np.uint8)
+    # Upsample each cell to cell_size pixels and push the whole frame in one call.
+    pixels = np.repeat(np.repeat(rgb, cell_size, axis=0), cell_size, axis=1)
+    pg.surfarray.blit_array(surface, pixels.swapaxes(0, 1))
+    surface.blit(cache.outline_overlay, (0, 0))
 
 
 def _draw_reactor(surface, world: "World", cell_size: int, pg) -> None:
@@ -124,6 +165,29 @@ def _draw_reactor(surface, world: "World", cell_size: int, pg) -> None:
     pg.draw.rect(surface, REACTOR_OUTLINE_COLOR, rect, width=2)
 
 
+_agent_marker_cache: dict = {}
+
+
+def _agent_marker(pg, radius: int, bucket: int):
+    """
+    Cached marker surface (base circle + energy indicator + outline) for a
+    given radius and quantized energy ratio.
+    """
+    key = (radius, bucket)
+    marker = _agent_marker_cache.get(key)
+    if marker is None:
+        side = radius * 2 + 4
+        center = (side // 2, side // 2)
+        ratio = bucket / _MARKER_BUCKETS
+        marker = pg.Surface((side, side), pg.SRCALPHA)
+        pg.draw.circle(marker, AGENT_BASE_COLOR, center, radius)
+        indicator_radius = max(2, int(radius * ratio)) if bucket > 0 else max(2, radius // 4)
+        pg.draw.circle(marker, _agent_energy_color(ratio), center, indicator_radius)
+        pg.draw.circle(marker, AGENT_OUTLINE_COLOR, center, radius, width=2)
+        _agent_marker_cache[key] = marker
+    return marker
+
+
 def _draw_agents(surface, world: "World", cell_size: int, pg, font) -> None:
     radius = max(6, int(cell_size * 0.35))
     agents = sorted(world.agents.values(), key=lambda agent: agent.id)
@@ -132,11 +196,10 @@ def _draw_agents(surface, world: "World", cell_size: int, pg, font) -> None:
         cx = x * cell_size + cell_size // 2
         cy = y * cell_size + cell_size // 2
         ratio = _agent_energy_ratio(agent)
-        indicator_color = _agent_energy_color(agent)
-        pg.draw.circle(surface, AGENT_BASE_COLOR, (cx, cy), radius)
-        indicator_radius = max(2, int(radius * ratio)) if ratio > 0 else max(2, radius // 4)
-        pg.draw.circle(surface, indicator_color, (cx, cy), indicator_radius)
-        pg.draw.circle(surface, AGENT_OUTLINE_COLOR, (cx, cy), radius, width=2)
+        bucket = max(0, min(_MARKER_BUCKETS, int(ratio * _MARKER_BUCKETS)))
+        marker = _agent_marker(pg, radius, bucket)
+        half = marker.get_width() // 2
+        surface.blit(marker, (cx - half, cy - half))
         requesting = getattr(world, "has_active_request", lambda _id: False)(agent.id)
         if requesting:
             request_ring = radius + max(2, cell_size // 8)
@@ -160,26 +223,94 @@ def _draw_agents(surface, world: "World", cell_size: int, pg, font) -> None:
 # Agent IDs look better without labels cluttering the grid, so we skip rendering text.
 
 
-def _draw_reactor_meter(surface, world: "World", pg, font) -> None:
-    level_ratio = getattr(world, "reactor_level_ratio", lambda: 0.0)()
-    level_ratio = max(0.0, min(1.0, level_ratio))
-    width, _ = surface.get_size()
+@dataclass
+class _MeterCache:
+    key: Tuple[Tuple[int, int], int]  # (surface size, id(font)) the cache was built for.
+    background: object  # Pre-rendered bar background plus "Reactor" label.
+    origin: Tuple[int, int]  # Where to blit the background on the target surface.
+    background_rect: object  # Absolute rect of the bar, for fill and outline.
+
+
+_meter_cache: Optional[_MeterCache] = None
+
+
+def _get_meter_cache(screen_size: Tuple[int, int], pg, font) -> _MeterCache:
+    global _meter_cache
+    key = (screen_size, id(font))
+    if _meter_cache is not None and _meter_cache.key == key:
+        return _meter_cache
+    width, _ = screen_size
     meter_width = min(240, max(140, width // 4))
     meter_height = 14
     padding = 12
     background_rect = pg.Rect(width - meter_width - padding, padding, meter_width, meter_height)
-    pg.draw.rect(surface, REACTOR_BAR_BACKGROUND, background_rect, border_radius=6)
+    label = font.render("Reactor", True, HUD_TEXT_COLOR) if font else None
+    label_height = label.get_height() + 4 if label else 0
+    background = pg.Surface((meter_width, label_height + meter_height), pg.SRCALPHA)
+    pg.draw.rect(
+        background,
+        REACTOR_BAR_BACKGROUND,
+        pg.Rect(0, label_height, meter_width, meter_height),
+        border_radius=6,
+    )
+    if label:
+        label_rect = label.get_rect()
+        label_rect.midbottom = (meter_width // 2, label_height - 4)
+        background.blit(label, label_rect)
+    origin = (background_rect.left, background_rect.top - label_height)
+    _meter_cache = _MeterCache(
+        key=key, background=background, origin=origin, background_rect=background_rect
+    )
+    return _meter_cache
+
+
+def _draw_reactor_meter(surface, world: "World", pg, font, screen_size: Tuple[int, int]) -> None:
+    level_ratio = getattr(world, "reactor_level_ratio", lambda: 0.0)()
+    level_ratio = max(0.0, min(1.0, level_ratio))
+    cache = _get_meter_cache(screen_size, pg, font)
+    background_rect = cache.background_rect
+    surface.blit(cache.background, cache.origin)
     if level_ratio > 0:
         fill_rect = background_rect.copy()
-        fill_rect.width = max(2, int(meter_width * level_ratio))
+        fill_rect.width = max(2, int(background_rect.width * level_ratio))
         pg.draw.rect(surface, REACTOR_BAR_FILL, fill_rect, border_radius=6)
     pg.draw.rect(surface, REACTOR_OUTLINE_COLOR, background_rect, width=2, border_radius=6)
-    if font:
-        label = font.render("Reactor", True, HUD_TEXT_COLOR)
-        label_rect = label.get_rect()
-        label_rect.midbottom = background_rect.midtop
-        label_rect.y -= 4
-        surface.blit(label, label_rect)
+
+
+@lru_cache(maxsize=256)
+def _render_hud_line(font, text: str):
+    return font.render(text, True, HUD_TEXT_COLOR)
+
+
+@dataclass
+class _HudCache:
+    key: Tuple[int, Tuple[str, ...]]  # (id(font), lines) the block was rendered for.
+    block: object  # Single surface holding every HUD line.
+
+
+_hud_cache: Optional[_HudCache] = None
+
+
+def _get_hud_block(lines: Tuple[str, ...], pg, font) -> object:
+    """
+    One surface holding the whole HUD text block. HUD lines only change when
+    the tick or pause state does, so most frames hit the cache and blit once
+    instead of rendering and blitting each line.
+    """
+    global _hud_cache
+    key = (id(font), lines)
+    if _hud_cache is not None and _hud_cache.key == key:
+        return _hud_cache.block
+    labels = [_render_hud_line(font, line) for line in lines]
+    width = max((label.get_width() for label in labels), default=1)
+    height = sum(label.get_height() + 4 for label in labels)
+    block = pg.Surface((max(1, width), max(1, height)), pg.SRCALPHA)
+    y = 0
+    for label in labels:
+        block.blit(label, (0, y))
+        y += label.get_height() + 4
+    _hud_cache = _HudCache(key=key, block=block)
+    return block
 
 
 def draw_hud(surface, lines: Iterable[str], pg, font, padding: int = 8) -> None:
@@ -188,11 +319,8 @@ def draw_hud(surface, lines: Iterable[str], pg, font, padding: int = 8) -> None:
     """
     if font is None:
         return
-    y = padding
-    for line in lines:
-        label = font.render(line, True, HUD_TEXT_COLOR)
-        surface.blit(label, (padding, y))
-        y += label.get_height() + 4
+    block = _get_hud_block(tuple(lines), pg, font)
+    surface.blit(block, (padding, padding))
 
 
 __all__ = ["require_pygame", "canvas_size", "draw_world", "draw_hud"]
@@ -1,27 +1,53 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import Dict, Tuple
+from typing import NamedTuple, Optional, Tuple
 
 AgentID = str
 Position = Tuple[int, int]
 
+# Bitmask flags for the four cardinal moves, as reported by World.moves_mask.
+MOVE_EAST = 1
+MOVE_WEST = 2
+MOVE_SOUTH = 4
+MOVE_NORTH = 8
 
-class Act(Enum):
-    MOVE = auto()
-    GATHER = auto()
-    DEPOSIT = auto()
-    REPORT = auto()
-    REQUEST = auto()
-    GIVE = auto()
 
+class Act:
+    """
+    Action kinds as plain int constants. Integers compare without Enum
+    dispatch overhead and double as indices into handler tables.
+    """
+
+    MOVE = 0
+    GATHER = 1
+    DEPOSIT = 2
+    REPORT = 3
+    REQUEST = 4
+    GIVE = 5
 
-@dataclass
-class Action:
-    kind: Act
-    actor: AgentID
-    params: Dict[str, int] = field(default_factory=dict)
 
+class Action(NamedTuple):
+    """
+    A single agent decision. Typed fields cover every action shape (MOVE uses
+    dx/dy, GIVE uses target/amount, the rest use amount or nothing), so no
+    per-action params dict is allocated.
+    """
 
-__all__ = ["AgentID", "Position", "Act", "Action"]
+    kind: int
+    actor: AgentID
+    dx: int = 0
+    dy: int = 0
+    amount: int = 0
+    target: Optional[AgentID] = None
+
+
+__all__ = [
+    "AgentID",
+    "Position",
+    "Act",
+    "Action",
+    "MOVE_EAST",
+    "MOVE_WEST",
+    "MOVE_SOUTH",
+    "MOVE_NORTH",
+]
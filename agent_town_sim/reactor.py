@@ -6,7 +6,7 @@ from typing import Tuple
 Position = Tuple[int, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class Reactor:
     position: Position
     capacity: int
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import random
-from typing import Iterable
+from typing import Set
 
 from .agent import Agent
 from .world import World
@@ -25,13 +25,18 @@ def seed_world(
     return world
 
 
-def _random_empty_cell(width: int, height: int, occupied: Iterable[tuple[int, int]]) -> tuple[int, int]:
-    occupied_set = set(occupied)
+def _random_empty_cell(width: int, height: int, occupied: Set[tuple[int, int]]) -> tuple[int, int]:
+    # Rejection sampling is O(1) expected while the grid is sparsely occupied;
+    # only fall back to enumerating every free cell when the draws keep missing.
+    for _ in range(32):
+        cell = (random.randrange(width), random.randrange(height))
+        if cell not in occupied:
+            return cell
     free_cells = [
         (x, y)
         for x in range(width)
         for y in range(height)
-        if (x, y) not in occupied_set
+        if (x, y) not in occupied
     ]
     if not free_cells:
         return 0, 0
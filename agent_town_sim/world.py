@@ -1,19 +1,55 @@
 from __future__ import annotations
 
+import os
 import random
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Optional
+from functools import lru_cache
+from typing import Deque, Dict, List, Set, Tuple, Optional
 
+import numpy as np
+
+from ._kernels import decay_energies, dwindle_grids
 from .agent import Agent
 from .config import DEBUG_MODE
-from .models import Act, Action, AgentID, Position
+from .models import (
+    Act,
+    Action,
+    AgentID,
+    Position,
+    MOVE_EAST,
+    MOVE_NORTH,
+    MOVE_SOUTH,
+    MOVE_WEST,
+)
 from .reactor import Reactor
 
 Move = Tuple[int, int]
+# How many deposit reports the world retains for the HUD history.
+DEPOSIT_REPORT_HISTORY = 50
 CARDINAL_MOVES: List[Move] = [(0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)]
-
-
-@dataclass
+_MOVE_BITS: Tuple[Tuple[int, int, int], ...] = (
+    (1, 0, MOVE_EAST),
+    (-1, 0, MOVE_WEST),
+    (0, 1, MOVE_SOUTH),
+    (0, -1, MOVE_NORTH),
+)
+
+
+@lru_cache(maxsize=16)
+def _diamond_offsets(radius: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (dx, dy) offset arrays for every cell within Manhattan distance `radius`,
+    cached per radius so visible_energy never re-enumerates the diamond.
+    """
+    span = np.arange(-radius, radius + 1, dtype=np.int32)
+    dx, dy = np.meshgrid(span, span)
+    keep = np.abs(dx) + np.abs(dy) <= radius
+    return dx[keep], dy[keep]
+
+
+@dataclass(slots=True)
 class World:
     width: int = 16  # Grid width in cells for the world.
     height: int = 12  # Grid height in cells for the world.
@@ -35,39 +71,81 @@ class World:
     aid_request_lifetime: int = -1  # Negative disables automatic expiry of requests.
     aid_give_min_amount: int = 5  # Minimum energy a donor aims to transfer when helping.
     help_signal_duration: int = -1  # Negative disables automatic expiry of helper highlights.
-    energy_grid: List[List[int]] = field(init=False, repr=False)
-    resource_grid: List[List[bool]] = field(init=False, repr=False)
+    parallel_choose_threshold: int = 32  # Agent count at which choose runs on a thread pool.
+    energy_grid: np.ndarray = field(init=False, repr=False)
+    resource_grid: np.ndarray = field(init=False, repr=False)
+    _free_resource_cells: Set[Position] = field(init=False, repr=False, default_factory=set)
     occupancy: Dict[Position, AgentID] = field(init=False, repr=False, default_factory=dict)
+    occupancy_grid: np.ndarray = field(init=False, repr=False)
+    _free_cells: Set[Position] = field(init=False, repr=False, default_factory=set)
+    agent_ids: List[AgentID] = field(init=False, repr=False, default_factory=list)
+    agent_index: Dict[AgentID, int] = field(init=False, repr=False, default_factory=dict)
+    agent_xy: np.ndarray = field(init=False, repr=False)
+    agent_energy: np.ndarray = field(init=False, repr=False)
+    _cell_head: np.ndarray = field(init=False, repr=False)
+    _next_agent: np.ndarray = field(init=False, repr=False)
+    _hash_tick: int = field(init=False, default=-1, repr=False)
+    _request_arrays: Optional[Tuple[List[AgentID], np.ndarray, np.ndarray]] = field(
+        init=False, default=None, repr=False
+    )
+    _request_arrays_tick: int = field(init=False, default=-1, repr=False)
+    _pruned_tick: int = field(init=False, default=-1, repr=False)
+    _signals_tick: int = field(init=False, default=-1, repr=False)
+    _has_signal_expiry: bool = field(init=False, default=False, repr=False)
+    _has_agent_decay: bool = field(init=False, default=False, repr=False)
+    _burns_fuel: bool = field(init=False, default=False, repr=False)
+    _reactor_pos: Position = field(init=False, repr=False)
+    _help_threshold: int = field(init=False, default=0, repr=False)
+    _choose_pool: Optional[ThreadPoolExecutor] = field(init=False, default=None, repr=False)
     reactor: Reactor = field(init=False, repr=False)
-    deposit_reports: List[Tuple[int, AgentID, int, int, bool]] = field(default_factory=list, repr=False)
+    deposit_reports: Deque[Tuple[int, AgentID, int, int, bool]] = field(
+        default_factory=lambda: deque(maxlen=DEPOSIT_REPORT_HISTORY), repr=False
+    )
     help_requests: Dict[AgentID, Tuple[Position, int, int]] = field(default_factory=dict, repr=False)
+    _request_cells: Dict[Position, Set[AgentID]] = field(
+        init=False, repr=False, default_factory=dict
+    )
     helper_signals: Dict[AgentID, int] = field(default_factory=dict, repr=False)
 
     def __post_init__(self) -> None:
-        self.energy_grid = []
-        self.resource_grid = []
+        density = max(0.0, min(1.0, self.resource_density))
+        self.resource_grid = np.random.random((self.height, self.width)) < density
+        self.energy_grid = np.where(self.resource_grid, self.max_energy, 0).astype(np.int32)
         self.occupancy = {}
+        # Dense mirror of `occupancy`: the occupant's agent_arrays() row, or
+        # -1 for an empty cell. Move legality checks read this instead of
+        # hashing position tuples.
+        self.occupancy_grid = np.full((self.height, self.width), -1, dtype=np.int32)
+        self._free_cells = {(x, y) for y in range(self.height) for x in range(self.width)}
         self.help_requests = {}
         self.helper_signals = {}
-        for _ in range(self.height):
-            energy_row: List[int] = []
-            resource_row: List[bool] = []
-            for _ in range(self.width):
-                has_resource = random.random() < max(0.0, min(1.0, self.resource_density))
-                resource_row.append(has_resource)
-                if has_resource:
-                    energy_value = self.max_energy
-                    energy_row.append(energy_value)
-                else:
-                    energy_row.append(0)
-            self.energy_grid.append(energy_row)
-            self.resource_grid.append(resource_row)
+        self.agent_ids = []
+        self.agent_index = {}
+        self.agent_xy = np.zeros((16, 2), dtype=np.int32)
+        self.agent_energy = np.zeros(16, dtype=np.int32)
+        self._cell_head = np.full((self.height, self.width), -1, dtype=np.int32)
+        self._next_agent = np.full(16, -1, dtype=np.int32)
+        self._hash_tick = -1
         cx, cy = self.width // 2, self.height // 2
         initial_energy = max(0, min(self.reactor_initial_energy, self.reactor_capacity))
         self.reactor = Reactor(position=(cx, cy), capacity=self.reactor_capacity, energy=initial_energy)
         if self.in_bounds(cx, cy):
-            self.resource_grid[cy][cx] = False
-            self.energy_grid[cy][cx] = 0
+            self.resource_grid[cy, cx] = False
+            self.energy_grid[cy, cx] = 0
+        # Cells eligible for a resource respawn, maintained incrementally so
+        # depletion never rescans the grid. The reactor cell stays excluded.
+        self._free_resource_cells = {
+            (int(fx), int(fy)) for fy, fx in np.argwhere(~self.resource_grid)
+        }
+        self._free_resource_cells.discard((cx, cy))
+        # Config-derived flags so step can skip calls that would no-op.
+        self._has_signal_expiry = self.help_signal_duration >= 0
+        self._has_agent_decay = self.agent_energy_decay > 0
+        self._burns_fuel = self.reactor_consumption_rate > 0
+        # Hot-path constants: the reactor never moves and the aid threshold
+        # is fixed config, so both are resolved once here.
+        self._reactor_pos = self.reactor.position
+        self._help_threshold = max(self.aid_request_threshold, self.agent_energy_decay)
 
     def add_agent(self, agent: Agent) -> None:
         x, y = agent.position
@@ -75,9 +153,93 @@ class World:
         agent.position = self._ensure_free_position(agent.position)
         self.agents[agent.id] = agent
         self.occupancy[agent.position] = agent.id
+        self._free_cells.discard(agent.position)
+        row = len(self.agent_ids)
+        if row == len(self.agent_energy):
+            self.agent_xy = np.concatenate([self.agent_xy, np.zeros_like(self.agent_xy)])
+            self.agent_energy = np.concatenate(
+                [self.agent_energy, np.zeros_like(self.agent_energy)]
+            )
+        self.agent_ids.append(agent.id)
+        self.agent_index[agent.id] = row
+        self.agent_xy[row] = agent.position
+        self.agent_energy[row] = agent.energy
+        self.occupancy_grid[agent.position[1], agent.position[0]] = row
+        self._hash_tick = -1
         if self.debug:
             self.log(f"Added agent {agent.id} at {agent.position}")
 
+    def agent_arrays(self) -> Tuple[List[AgentID], np.ndarray, np.ndarray]:
+        """
+        Structure-of-arrays views over the active agents: (ids, xy[N, 2],
+        energy[N]). The arrays are live; treat them as read-only.
+        """
+        count = len(self.agent_ids)
+        return self.agent_ids, self.agent_xy[:count], self.agent_energy[:count]
+
+    def _rebuild_agent_hash(self) -> None:
+        count = len(self.agent_ids)
+        if self._next_agent.shape[0] < count:
+            self._next_agent = np.full(len(self.agent_energy), -1, dtype=np.int32)
+        self._cell_head.fill(-1)
+        head = self._cell_head
+        nxt = self._next_agent
+        xy = self.agent_xy
+        for row in range(count):
+            ax, ay = xy[row]
+            nxt[row] = head[ay, ax]
+            head[ay, ax] = row
+        self._hash_tick = self.tick
+
+    def agents_near(self, center: Position, radius: int) -> Optional[List[int]]:
+        """
+        Rows into agent_arrays() for agents within a Chebyshev box of `radius`
+        around `center`. Returns None when the box covers at least as many
+        cells as there are agents, in which case a plain scan is cheaper.
+        """
+        count = len(self.agent_ids)
+        cx, cy = center
+        x0, x1 = max(0, cx - radius), min(self.width - 1, cx + radius)
+        y0, y1 = max(0, cy - radius), min(self.height - 1, cy + radius)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) >= count:
+            return None
+        if self._hash_tick != self.tick:
+            self._rebuild_agent_hash()
+        head = self._cell_head
+        nxt = self._next_agent
+        rows: List[int] = []
+        for yy in range(y0, y1 + 1):
+            for xx in range(x0, x1 + 1):
+                row = int(head[yy, xx])
+                while row >= 0:
+                    rows.append(row)
+                    row = int(nxt[row])
+        return rows
+
+    def _sync_agent(self, agent: Agent) -> None:
+        row = self.agent_index.get(agent.id)
+        if row is None:
+            return
+        self.agent_xy[row] = agent.position
+        self.agent_energy[row] = agent.energy
+        self._hash_tick = -1
+
+    def _drop_agent_row(self, agent_id: AgentID) -> None:
+        row = self.agent_index.pop(agent_id, None)
+        if row is None:
+            return
+        last = len(self.agent_ids) - 1
+        moved_id = self.agent_ids[last]
+        if row != last:
+            self.agent_ids[row] = moved_id
+            self.agent_xy[row] = self.agent_xy[last]
+            self.agent_energy[row] = self.agent_energy[last]
+            self.agent_index[moved_id] = row
+            mx, my = self.agent_xy[row]
+            self.occupancy_grid[my, mx] = row
+        self.agent_ids.pop()
+        self._hash_tick = -1
+
     def log(self, message: str) -> None:
         if self.debug:
             print(f"[Tick {self.tick:04d}] {message}")
@@ -89,16 +251,14 @@ class World:
         return self.occupancy.get((x, y))
 
     def is_occupied(self, x: int, y: int) -> bool:
-        return self._occupant(x, y) is not None
+        return self.occupancy_grid[y, x] >= 0
 
     def _ensure_free_position(self, position: Position) -> Position:
         x, y = position
         if not self.is_occupied(x, y):
             return position
-        for ny in range(self.height):
-            for nx in range(self.width):
-                if not self.is_occupied(nx, ny):
-                    return nx, ny
+        if self._free_cells:
+            return next(iter(self._free_cells))
         raise RuntimeError("World is fully occupied; cannot place agent.")
 
     def in_bounds(self, x: int, y: int) -> bool:
@@ -107,23 +267,29 @@ class World:
     def cell_energy(self, x: int, y: int) -> int:
         if not self.in_bounds(x, y):
             return 0
-        return self.energy_grid[y][x]
+        return int(self.energy_grid[y, x])
+
+    def energy_array(self) -> np.ndarray:
+        """
+        Dense (height, width) int32 view of the energy grid; treat as read-only.
+        """
+        return self.energy_grid
 
     def visible_energy(self, center: Position, radius: int) -> List[Tuple[Position, int]]:
         cx, cy = center
-        visible: List[Tuple[Position, int]] = []
-        for dx in range(-radius, radius + 1):
-            for dy in range(-radius, radius + 1):
-                if abs(dx) + abs(dy) > radius:
-                    continue
-                nx, ny = cx + dx, cy + dy
-                if not self.in_bounds(nx, ny):
-                    continue
-                visible.append(((nx, ny), self.energy_grid[ny][nx]))
-        return visible
+        dx, dy = _diamond_offsets(radius)
+        nx = cx + dx
+        ny = cy + dy
+        mask = (nx >= 0) & (nx < self.width) & (ny >= 0) & (ny < self.height)
+        nx, ny = nx[mask], ny[mask]
+        values = self.energy_grid[ny, nx]
+        return [
+            ((x, y), value)
+            for x, y, value in zip(nx.tolist(), ny.tolist(), values.tolist())
+        ]
 
     def reactor_position(self) -> Position:
-        return self.reactor.position
+        return self._reactor_pos
 
     def reactor_level_ratio(self) -> float:
         return self.reactor.level_ratio()
@@ -142,6 +308,90 @@ class World:
             requests[agent_id] = (position, amount)
         return requests
 
+    def help_request_arrays(self) -> Tuple[List[AgentID], np.ndarray, np.ndarray]:
+        """
+        Active help requests in array form: (ids, xy[N, 2], amount[N]), cached
+        until the tick advances or a request changes.
+        """
+        if self._request_arrays is None or self._request_arrays_tick != self.tick:
+            requests = self.active_help_requests()
+            count = len(requests)
+            xy = np.zeros((count, 2), dtype=np.int32)
+            amounts = np.zeros(count, dtype=np.int32)
+            ids: List[AgentID] = []
+            for index, (agent_id, (position, amount)) in enumerate(requests.items()):
+                ids.append(agent_id)
+                xy[index] = position
+                amounts[index] = amount
+            self._request_arrays = (ids, xy, amounts)
+            self._request_arrays_tick = self.tick
+        return self._request_arrays
+
+    def _invalidate_request_arrays(self) -> None:
+        self._request_arrays = None
+
+    def _set_request_entry(self, agent_id: AgentID, position: Position, amount: int, tick: int) -> None:
+        """
+        Write a help-request entry, keeping the per-cell buckets in sync.
+        """
+        old = self.help_requests.get(agent_id)
+        if old is not None and old[0] != position:
+            bucket = self._request_cells.get(old[0])
+            if bucket is not None:
+                bucket.discard(agent_id)
+                if not bucket:
+                    del self._request_cells[old[0]]
+        self.help_requests[agent_id] = (position, amount, tick)
+        self._request_cells.setdefault(position, set()).add(agent_id)
+        self._invalidate_request_arrays()
+
+    def _pop_request_entry(self, agent_id: AgentID) -> None:
+        entry = self.help_requests.pop(agent_id, None)
+        if entry is None:
+            return
+        bucket = self._request_cells.get(entry[0])
+        if bucket is not None:
+            bucket.discard(agent_id)
+            if not bucket:
+                del self._request_cells[entry[0]]
+        self._invalidate_request_arrays()
+
+    def requests_near(self, center: Position, radius: int) -> List[Tuple[AgentID, Position, int]]:
+        """
+        Active help requests within a Chebyshev box of `radius` around
+        `center`, as (agent_id, position, amount) tuples. Scans whichever is
+        smaller: the window's cells or the occupied request buckets.
+        """
+        self._prune_help_requests()
+        buckets = self._request_cells
+        if not buckets:
+            return []
+        cx, cy = center
+        x0, x1 = max(0, cx - radius), min(self.width - 1, cx + radius)
+        y0, y1 = max(0, cy - radius), min(self.height - 1, cy + radius)
+        # Resolve entries with .get and skip misses rather than trusting the
+        # buckets to be perfectly in sync with help_requests; this method is
+        # called from choose, which step may run on a thread pool.
+        entries = self.help_requests
+        results: List[Tuple[AgentID, Position, int]] = []
+        if (x1 - x0 + 1) * (y1 - y0 + 1) <= len(buckets):
+            for yy in range(y0, y1 + 1):
+                for xx in range(x0, x1 + 1):
+                    ids = buckets.get((xx, yy))
+                    if ids:
+                        for agent_id in tuple(ids):
+                            entry = entries.get(agent_id)
+                            if entry is not None:
+                                results.append((agent_id, (xx, yy), entry[1]))
+        else:
+            for position, ids in tuple(buckets.items()):
+                if x0 <= position[0] <= x1 and y0 <= position[1] <= y1:
+                    for agent_id in tuple(ids):
+                        entry = entries.get(agent_id)
+                        if entry is not None:
+                            results.append((agent_id, position, entry[1]))
+        return results
+
     def has_active_request(self, agent_id: AgentID) -> bool:
         self._prune_help_requests()
         return self._request_entry(agent_id) is not None
@@ -152,17 +402,29 @@ class World:
             return False
         return self.tick - last_tick <= max(0, self.help_signal_duration)
 
+    def moves_mask(self, agent: Agent) -> int:
+        """
+        Bitmask of unblocked cardinal moves for the agent; idling is always legal.
+        """
+        x, y = agent.position
+        width, height = self.width, self.height
+        occ = self.occupancy_grid
+        mask = 0
+        for dx, dy, bit in _MOVE_BITS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height and occ[ny, nx] < 0:
+                mask |= bit
+        return mask
+
     def available_moves(self, agent: Agent) -> List[Move]:
         x, y = agent.position
+        width, height = self.width, self.height
+        occ = self.occupancy_grid
         moves = []
         for dx, dy in CARDINAL_MOVES:
             nx, ny = x + dx, y + dy
-            if self.in_bounds(nx, ny):
-                if dx == 0 and dy == 0:
-                    moves.append((dx, dy))
-                    continue
-                occupant = self._occupant(nx, ny)
-                if occupant is None:
+            if 0 <= nx < width and 0 <= ny < height:
+                if (dx == 0 and dy == 0) or occ[ny, nx] < 0:
                     moves.append((dx, dy))
         return moves or [(0, 0)]
 
@@ -170,25 +432,38 @@ class World:
         agent = self.agents.get(action.actor)
         if agent is None:
             return
-        if action.kind is Act.MOVE:
-            dx = int(action.params.get("dx", 0))
-            dy = int(action.params.get("dy", 0))
-            self._move(agent, dx, dy)
-        elif action.kind is Act.GATHER:
-            self._gather_energy(agent)
-        elif action.kind is Act.DEPOSIT:
-            self._deposit_energy(agent)
-        elif action.kind is Act.REPORT:
-            amount = int(action.params.get("amount", 0))
-            self._record_deposit_report(agent, amount)
-        elif action.kind is Act.REQUEST:
-            amount = int(action.params.get("amount", 0))
-            self._register_help_request(agent, amount)
-        elif action.kind is Act.GIVE:
-            target = action.params.get("target")
-            amount = int(action.params.get("amount", 0))
-            if isinstance(target, str):
-                self._give_energy(agent, target, amount)
+        kind = action.kind
+        if 0 <= kind < len(self._ACTION_HANDLERS):
+            self._ACTION_HANDLERS[kind](self, agent, action)
+
+    def _apply_move_action(self, agent: Agent, action: Action) -> None:
+        self._move(agent, action.dx, action.dy)
+
+    def _apply_gather_action(self, agent: Agent, action: Action) -> None:
+        self._gather_energy(agent)
+
+    def _apply_deposit_action(self, agent: Agent, action: Action) -> None:
+        self._deposit_energy(agent)
+
+    def _apply_report_action(self, agent: Agent, action: Action) -> None:
+        self._record_deposit_report(agent, action.amount)
+
+    def _apply_request_action(self, agent: Agent, action: Action) -> None:
+        self._register_help_request(agent, action.amount)
+
+    def _apply_give_action(self, agent: Agent, action: Action) -> None:
+        if action.target is not None:
+            self._give_energy(agent, action.target, action.amount)
+
+    # Indexed by Act constants; keep the order in sync with models.Act.
+    _ACTION_HANDLERS = (
+        _apply_move_action,
+        _apply_gather_action,
+        _apply_deposit_action,
+        _apply_report_action,
+        _apply_request_action,
+        _apply_give_action,
+    )
 
     def move_agent(self, agent_id: AgentID, dx: int, dy: int) -> None:
         agent = self.agents.get(agent_id)
@@ -199,18 +474,31 @@ class World:
     def _move(self, agent: Agent, dx: int, dy: int) -> None:
         x, y = agent.position
         nx, ny = x + dx, y + dy
-        if not self.in_bounds(nx, ny):
-            nx, ny = self._clamp(nx, ny)
-        if (nx, ny) == (x, y):
+        # Bounds check and clamp inlined; this runs for nearly every agent
+        # every tick.
+        width, height = self.width, self.height
+        if not (0 <= nx < width and 0 <= ny < height):
+            nx = 0 if nx < 0 else (width - 1 if nx >= width else nx)
+            ny = 0 if ny < 0 else (height - 1 if ny >= height else ny)
+        if nx == x and ny == y:
             return
-        occupant = self._occupant(nx, ny)
+        occupancy = self.occupancy
+        occupant = occupancy.get((nx, ny))
         if occupant is not None and occupant != agent.id:
             if self.debug:
                 self.log(f"{agent.name} blocked by {occupant} at {(nx, ny)}")
             return
-        self.occupancy.pop((x, y), None)
-        self.occupancy[(nx, ny)] = agent.id
+        occupancy.pop((x, y), None)
+        occupancy[(nx, ny)] = agent.id
+        row = self.agent_index.get(agent.id, -1)
+        occupancy_grid = self.occupancy_grid
+        occupancy_grid[y, x] = -1
+        occupancy_grid[ny, nx] = row
+        free_cells = self._free_cells
+        free_cells.add((x, y))
+        free_cells.discard((nx, ny))
         agent.position = (nx, ny)
+        self._sync_agent(agent)
         self._update_request_position(agent)
         if self.debug and (dx or dy):
             self.log(f"{agent.name} moved to {agent.position}")
@@ -222,15 +510,16 @@ class World:
         if available <= 0:
             return
         collected = available
-        self.energy_grid[y][x] = 0
+        self.energy_grid[y, x] = 0
         agent.energy += collected
+        self._sync_agent(agent)
         self._maybe_clear_help_request(agent)
         if self.debug:
             self.log(f"{agent.name} gathered {collected} energy (total {agent.energy})")
         self._deplete_resource((x, y))
 
     def _deposit_energy(self, agent: Agent) -> None:
-        if agent.position != self.reactor.position:
+        if agent.position != self._reactor_pos:
             return
         excess = max(0, agent.energy - self.reactor_agent_reserve)
         if excess <= 0:
@@ -243,6 +532,7 @@ class World:
             return
         agent.energy -= deposited
         agent.pending_report += deposited
+        self._sync_agent(agent)
         if self.debug:
             self.log(
                 f"{agent.name} deposited {deposited} energy into reactor (level {self.reactor.energy})"
@@ -258,8 +548,6 @@ class World:
             agent.pending_report = max(0, pending_before - actual)
         lie = claimed != actual
         self.deposit_reports.append((self.tick, agent.id, actual, claimed, lie))
-        if len(self.deposit_reports) > 50:
-            self.deposit_reports.pop(0)
         if self.debug:
             honesty = "honest" if not lie else "dishonest"
             self.log(
@@ -268,12 +556,12 @@ class World:
             )
 
     def _auto_deposit(self, agent: Agent) -> None:
-        if agent.position != self.reactor.position:
+        if agent.position != self._reactor_pos:
             return
         self._deposit_energy(agent)
 
     def _register_help_request(self, agent: Agent, amount: int) -> None:
-        threshold = max(self.aid_request_threshold, self.agent_energy_decay)
+        threshold = self._help_threshold
         desired_default = max(0, threshold - agent.energy)
         if agent.max_capacity is None:
             capacity_headroom: Optional[int] = None
@@ -283,7 +571,7 @@ class World:
         requested = max(desired_default, request_cap)
         if requested <= 0:
             return
-        self.help_requests[agent.id] = (agent.position, requested, self.tick)
+        self._set_request_entry(agent.id, agent.position, requested, self.tick)
         if self.debug:
             self.log(f"{agent.name} requested {requested} energy from nearby allies")
 
@@ -292,16 +580,16 @@ class World:
         if entry is None:
             return
         _, amount, tick = entry
-        self.help_requests[agent.id] = (agent.position, amount, tick)
+        self._set_request_entry(agent.id, agent.position, amount, tick)
 
     def _maybe_clear_help_request(self, agent: Agent) -> None:
         entry = self.help_requests.get(agent.id)
         if entry is None:
             return
         position, amount, tick_logged = entry
-        threshold = max(self.aid_request_threshold, self.agent_energy_decay)
+        threshold = self._help_threshold
         if agent.energy > threshold:
-            self.help_requests.pop(agent.id, None)
+            self._pop_request_entry(agent.id)
             return
         capacity_headroom = None
         if agent.max_capacity is not None:
@@ -313,12 +601,14 @@ class World:
             shortfall = min(shortfall, capacity_headroom)
         desired = shortfall
         if desired <= 0:
-            self.help_requests.pop(agent.id, None)
-        else:
-            self.help_requests[agent.id] = (position, desired, self.tick)
+            self._pop_request_entry(agent.id)
+        elif desired != amount:
+            self._set_request_entry(agent.id, position, desired, self.tick)
+        # An unchanged amount keeps the existing entry (and its logged tick);
+        # rewriting it would only churn the dict and the cached arrays.
 
     def _clear_help_request(self, agent_id: AgentID) -> None:
-        self.help_requests.pop(agent_id, None)
+        self._pop_request_entry(agent_id)
 
     def cancel_help_request(self, agent_id: AgentID) -> None:
         self._clear_help_request(agent_id)
@@ -337,17 +627,25 @@ class World:
         return position, amount, tick_logged
 
     def _prune_help_requests(self) -> None:
+        # Pruning is idempotent within a tick; _request_entry still validates
+        # entries on every read, so skipping repeat sweeps is safe.
+        if self._pruned_tick == self.tick:
+            return
+        self._pruned_tick = self.tick
         stale = [
             agent_id
             for agent_id, entry in self.help_requests.items()
             if self._request_entry(agent_id) is None
         ]
         for agent_id in stale:
-            self.help_requests.pop(agent_id, None)
+            self._pop_request_entry(agent_id)
 
     def _decay_helper_signals(self) -> None:
         if self.help_signal_duration < 0:
             return
+        if self._signals_tick == self.tick:
+            return
+        self._signals_tick = self.tick
         expiry = max(0, self.help_signal_duration)
         expired = [
             agent_id
@@ -387,11 +685,13 @@ class World:
             return
         donor.energy -= transfer_capacity
         recipient.energy += transfer_capacity
+        self._sync_agent(donor)
+        self._sync_agent(recipient)
         if request_entry:
             _, outstanding, _ = request_entry
             updated_amount = max(0, outstanding - transfer_capacity)
             if updated_amount > 0:
-                self.help_requests[recipient.id] = (recipient.position, updated_amount, self.tick)
+                self._set_request_entry(recipient.id, recipient.position, updated_amount, self.tick)
             else:
                 self._clear_help_request(recipient.id)
         self._maybe_clear_help_request(recipient)
@@ -403,38 +703,32 @@ class World:
 
     def _deplete_resource(self, position: Position) -> None:
         x, y = position
-        self.energy_grid[y][x] = 0
-        self.resource_grid[y][x] = False
+        self.energy_grid[y, x] = 0
+        self.resource_grid[y, x] = False
+        self._free_resource_cells.add(position)
         self._respawn_resource(position)
 
     def _respawn_resource(self, depleted_position: Position) -> None:
-        candidates = [
-            (cx, cy)
-            for cy in range(self.height)
-            for cx in range(self.width)
-            if not self.resource_grid[cy][cx] and (cx, cy) != depleted_position
-        ]
+        candidates = self._free_resource_cells - {depleted_position}
         if candidates:
-            target = random.choice(candidates)
+            target = random.choice(tuple(candidates))
         else:
             target = depleted_position
+        self._free_resource_cells.discard(target)
         tx, ty = target
-        self.resource_grid[ty][tx] = True
-        self.energy_grid[ty][tx] = self.max_energy
+        self.resource_grid[ty, tx] = True
+        self.energy_grid[ty, tx] = self.max_energy
         if self.debug:
             self.log(f"Resource respawned at {(tx, ty)} with {self.max_energy} energy")
 
     def _dwindle_resources(self, amount: int) -> None:
         if amount <= 0:
             return
-        for y, row in enumerate(self.energy_grid):
-            for x, value in enumerate(row):
-                if value <= 0:
-                    continue
-                new_value = max(0, value - amount)
-                row[x] = new_value
-                if new_value <= 0 and self.resource_grid[y][x]:
-                    self.resource_grid[y][x] = False
+        exhausted = dwindle_grids(self.energy_grid, self.resource_grid, amount)
+        if exhausted.size:
+            width = self.width
+            for flat in exhausted:
+                self._free_resource_cells.add((int(flat) % width, int(flat) // width))
 
     def _consume_reactor_energy(self) -> None:
         if self.reactor_consumption_rate <= 0:
@@ -451,41 +745,106 @@ class World:
     def _decay_agent_energy(self) -> None:
         if self.agent_energy_decay <= 0:
             return
-        to_remove: List[AgentID] = []
-        for agent_id, agent in list(self.agents.items()):
-            current_energy = agent.energy
-            next_energy = max(0, current_energy - self.agent_energy_decay)
-            agent.energy = next_energy
-            if next_energy <= 0:
-                to_remove.append(agent_id)
+        count = len(self.agent_ids)
+        if count == 0:
+            return
+        energies = self.agent_energy[:count]
+        dead_rows = decay_energies(energies, self.agent_energy_decay)
+        agents = self.agents
+        for agent_id, energy in zip(self.agent_ids, energies.tolist()):
+            agents[agent_id].energy = energy
+        # Resolve rows to ids before removal; the swap-pop renumbers rows.
+        to_remove = [self.agent_ids[int(row)] for row in dead_rows]
         for agent_id in to_remove:
             agent = self.agents.pop(agent_id, None)
             if agent is None:
                 continue
             self.occupancy.pop(agent.position, None)
-            self.help_requests.pop(agent_id, None)
+            self.occupancy_grid[agent.position[1], agent.position[0]] = -1
+            self._free_cells.add(agent.position)
+            self._pop_request_entry(agent_id)
             self.helper_signals.pop(agent_id, None)
+            self._drop_agent_row(agent_id)
             if self.debug:
                 self.log(f"Removed agent {agent.id} at {agent.position} (energy depleted)")
 
+    def _ensure_choose_pool(self) -> ThreadPoolExecutor:
+        if self._choose_pool is None:
+            self._choose_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+        return self._choose_pool
+
     def step(self) -> None:
         self.tick += 1
         self._prune_help_requests()
-        self._decay_helper_signals()
-        for agent in list(self.agents.values()):
-            self._auto_deposit(agent)
-            action = agent.choose(self)
-            agent.pending_action = action
-        for agent in list(self.agents.values()):
-            action = agent.pending_action
+        if self._has_signal_expiry:
+            self._decay_helper_signals()
+        # Bound methods are looked up once; the loops below run per agent.
+        snapshot = list(self.agents.values())
+        auto_deposit = self._auto_deposit
+        # Requests from agents that have recovered are cancelled here, before
+        # the decision phase, so choose never mutates the request structures.
+        # The threshold mirrors the one choose uses for low_on_energy.
+        if self.help_requests:
+            recovery_threshold = max(max(1, self.agent_energy_decay), self.aid_request_threshold)
+            for agent in snapshot:
+                if agent.id in self.help_requests and agent.energy > recovery_threshold:
+                    self.cancel_help_request(agent.id)
+        if 0 < self.parallel_choose_threshold <= len(snapshot):
+            # With the cancellations above done, choose is read-only with
+            # respect to the world and the decision phase is embarrassingly
+            # parallel. Deposits run first, and the spatial hash is rebuilt
+            # up front so workers do not race on rebuilding it; actions are
+            # applied serially below as usual.
+            for agent in snapshot:
+                auto_deposit(agent)
+            self._rebuild_agent_hash()
+            pool = self._ensure_choose_pool()
+            actions = list(pool.map(lambda agent: agent.choose(self), snapshot))
+        else:
+            actions = []
+            for agent in snapshot:
+                auto_deposit(agent)
+                actions.append(agent.choose(self))
+        # Agents are only removed at end-of-tick decay, so the snapshot is
+        # still valid here; apply() itself ignores actors that vanished.
+        # Moves resolve as a parallel update: every intended target is
+        # collected first and cells claimed by several agents go to one
+        # random winner, so contention no longer favours snapshot order.
+        apply_action = self.apply
+        width, height = self.width, self.height
+        claims: Dict[Position, List[Action]] = defaultdict(list)
+        for agent, action in zip(snapshot, actions):
             if action is None:
                 continue
-            self.apply(action)
-            agent.pending_action = None
-        self._decay_agent_energy()
-        self._consume_reactor_energy()
+            if action.kind == Act.MOVE:
+                x, y = agent.position
+                nx, ny = x + action.dx, y + action.dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    nx = 0 if nx < 0 else (width - 1 if nx >= width else nx)
+                    ny = 0 if ny < 0 else (height - 1 if ny >= height else ny)
+                if nx == x and ny == y:
+                    continue
+                claims[(nx, ny)].append(action)
+            else:
+                apply_action(action)
+        for claimants in claims.values():
+            winner = claimants[0] if len(claimants) == 1 else random.choice(claimants)
+            apply_action(winner)
+        if self._has_agent_decay:
+            self._decay_agent_energy()
+        if self._burns_fuel:
+            self._consume_reactor_energy()
         self._apply_reactor_consequences()
 
+    def step_many(self, count: int) -> None:
+        """
+        Advance the simulation `count` ticks in one call, amortizing the
+        per-call dispatch overhead when the caller has fallen behind.
+        """
+        step = self.step
+        for _ in range(int(count)):
+            step()
+
     def agent_positions(self) -> Dict[AgentID, Position]:
         return {agent_id: agent.position for agent_id, agent in self.agents.items()}
 